@@ -1,54 +1,189 @@
 #!/usr/bin/env python3
-"""Search YouTube videos for a word and print timestamps.
+"""Search YouTube videos for words and print timestamps.
 
 This script queries the YouTube Data API for videos matching a given search
-string and scans each video's transcript for a target word. When the word is
-found, it prints a direct URL to the timestamp of each occurrence.
+string and scans each video's transcript for one or more target words. When a
+word is found, it prints a direct URL to the timestamp of each occurrence.
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import itertools
 import os
+import pickle
+import re
+import sqlite3
 import sys
-from typing import List, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, NamedTuple, Sequence, Tuple
 
+from diskcache import Cache, Timeout
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from youtube_transcript_api import YouTubeTranscriptApi
 
+CACHE_DIR = os.path.expanduser("~/.cache/yt_word_scanner")
+TRANSCRIPT_TTL = 7 * 24 * 60 * 60  # seconds
+SEARCH_TTL = 60 * 60  # seconds
+MAX_PAGE_SIZE = 50  # YouTube Data API limit for search.list
+URL_TEMPLATE = "https://www.youtube.com/watch?v={video_id}&t={timestamp}s"
 
-def search_videos(query: str, api_key: str, *, max_results: int = 5) -> List[str]:
-    """Return a list of video IDs from a YouTube search."""
+# Raised by an unusable cache directory or a corrupt entry. The cache is then
+# skipped instead of failing the run.
+_CACHE_ERRORS = (OSError, sqlite3.Error, Timeout, pickle.UnpicklingError, EOFError, ValueError)
 
-    youtube = build("youtube", "v3", developerKey=api_key)
-    request = youtube.search().list(
-        q=query,
-        part="id",
-        type="video",
-        maxResults=max_results,
-    )
-    response = request.execute()
-    return [item["id"]["videoId"] for item in response.get("items", [])]
 
+@functools.lru_cache(maxsize=4)
+def _youtube_client(api_key: str):
+    """Return a YouTube Data API client, reused across calls per API key."""
+
+    # The bundled static discovery document avoids an extra HTTP request.
+    return build("youtube", "v3", developerKey=api_key, static_discovery=True)
+
+
+class TranscriptCue(NamedTuple):
+    """A single transcript line and the second it starts at."""
+
+    text: str
+    start: float
+
+
+@functools.lru_cache(maxsize=None)
+def _disk_cache() -> Cache:
+    """Return the on-disk cache, opening it on first use."""
+
+    return Cache(CACHE_DIR)
+
+
+def _cache_get(key):
+    """Return the disk cache entry for ``key``, or None if unavailable."""
+
+    try:
+        return _disk_cache().get(key)
+    except _CACHE_ERRORS:
+        return None
+
+
+def _cache_set(key, value, expire: int) -> None:
+    """Store ``value`` in the disk cache, ignoring cache failures."""
+
+    try:
+        _disk_cache().set(key, value, expire=expire)
+    except _CACHE_ERRORS:
+        pass
+
+
+def search_videos(
+    query: str, api_key: str, *, max_results: int = 5, use_cache: bool = True
+) -> List[str]:
+    """Return a list of video IDs from a YouTube search.
+
+    The API returns at most 50 results per page, so larger requests are
+    fetched across several pages. Results are cached on disk for an hour,
+    keyed by a hash of the API key so the key itself is never stored.
+    """
+
+    cache_key = ("search", query, max_results, hashlib.sha256(api_key.encode()).hexdigest())
+    if use_cache:
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+    youtube = _youtube_client(api_key)
+    video_ids: List[str] = []
+    page_token = None
+    while len(video_ids) < max_results:
+        request = youtube.search().list(
+            q=query,
+            part="id",
+            type="video",
+            maxResults=min(MAX_PAGE_SIZE, max_results - len(video_ids)),
+            pageToken=page_token,
+        )
+        response = request.execute()
+        video_ids.extend(item["id"]["videoId"] for item in response.get("items", []))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+    video_ids = video_ids[:max_results]
+
+    if use_cache:
+        _cache_set(cache_key, tuple(video_ids), SEARCH_TTL)
+    return video_ids
 
-def find_word_in_video(video_id: str, word: str) -> List[Tuple[str, int]]:
-    """Return list of tuples (url, timestamp) where the word appears."""
+
+@functools.lru_cache(maxsize=1024)
+def _get_transcript(video_id: str, use_cache: bool = True) -> Tuple[TranscriptCue, ...]:
+    """Return a video's transcript as cached cues."""
+
+    if use_cache:
+        cached = _cache_get(("transcript", video_id))
+        if cached is not None:
+            try:
+                return tuple(map(TranscriptCue._make, cached))
+            except TypeError:
+                pass  # Malformed entry, fetch the transcript again
 
     try:
         transcript = YouTubeTranscriptApi.get_transcript(video_id)
     except Exception:
         # Some videos don't have transcripts available
-        return []
+        return ()
+    result = tuple(TranscriptCue(entry["text"], entry["start"]) for entry in transcript)
+
+    if use_cache:
+        # Store plain tuples so entries written when run as a script can still
+        # be unpickled when this file is imported as a module.
+        _cache_set(("transcript", video_id), tuple(map(tuple, result)), TRANSCRIPT_TTL)
+    return result
+
+
+def compile_words(words: Sequence[str]) -> re.Pattern[str]:
+    """Return a pattern matching any of ``words`` in casefolded text."""
+
+    # A single alternation lets the regex engine look for every word in one
+    # pass over each cue. Casefolding both sides, rather than re.IGNORECASE,
+    # also catches caseless matches such as "straße" in "STRASSE".
+    return re.compile("|".join(re.escape(word.casefold()) for word in words))
+
+
+def scan_cues(
+    video_id: str,
+    cues: Sequence[TranscriptCue],
+    pattern: re.Pattern[str],
+    *,
+    first_only: bool = False,
+) -> Iterator[Tuple[str, int]]:
+    """Yield tuples (url, timestamp) for the cues where ``pattern`` matches.
+
+    ``pattern`` should come from :func:`compile_words`, as each cue is
+    casefolded before matching.
+
+    With ``first_only`` the scan stops at the first match.
+    """
+
+    for cue in cues:
+        if pattern.search(cue.text.casefold()):
+            timestamp = int(cue.start)
+            yield URL_TEMPLATE.format(video_id=video_id, timestamp=timestamp), timestamp
+            if first_only:
+                return
 
-    results: List[Tuple[str, int]] = []
-    lowered = word.lower()
-    for entry in transcript:
-        if lowered in entry["text"].lower():
-            timestamp = int(entry["start"])
-            url = f"https://www.youtube.com/watch?v={video_id}&t={timestamp}s"
-            results.append((url, timestamp))
-    return results
+
+def find_word_in_video(
+    video_id: str,
+    pattern: re.Pattern[str],
+    *,
+    first_only: bool = False,
+    use_cache: bool = True,
+) -> Iterator[Tuple[str, int]]:
+    """Fetch a video's transcript and yield (url, timestamp) matches."""
+
+    cues = _get_transcript(video_id, use_cache)
+    yield from scan_cues(video_id, cues, pattern, first_only=first_only)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -56,7 +191,7 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("query", help="YouTube search query")
-    parser.add_argument("word", help="Word to look for in transcripts")
+    parser.add_argument("words", nargs="+", help="Words to look for in transcripts")
     parser.add_argument(
         "--max-results",
         type=int,
@@ -67,24 +202,56 @@ def main(argv: Sequence[str] | None = None) -> int:
         "--api-key",
         help="YouTube Data API key (defaults to YOUTUBE_API_KEY env var)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not read or write the search and transcript cache in {CACHE_DIR}",
+    )
+    parser.add_argument(
+        "--first-only",
+        action="store_true",
+        help="Only report the first occurrence in each video",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of transcripts to fetch concurrently (default: 8)",
+    )
     args = parser.parse_args(argv)
 
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    use_cache = not args.no_cache
+
     api_key = args.api_key or os.getenv("YOUTUBE_API_KEY")
     if not api_key:
         parser.error("YOUTUBE_API_KEY environment variable not set and --api-key not provided")
 
     try:
-        video_ids = search_videos(args.query, api_key, max_results=args.max_results)
+        video_ids = search_videos(
+            args.query, api_key, max_results=args.max_results, use_cache=use_cache
+        )
     except HttpError as exc:
         print(f"YouTube API error: {exc}", file=sys.stderr)
         return 1
 
+    pattern = compile_words(args.words)
     found = False
-    for vid in video_ids:
-        matches = find_word_in_video(vid, args.word)
-        for url, ts in matches:
-            found = True
-            print(f"{url} (at {ts}s)")
+    # Transcript fetching is I/O bound, so fetch in parallel. Each transcript
+    # is scanned and printed from the main thread in search order as soon as
+    # it is ready.
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        transcripts = executor.map(_get_transcript, video_ids, itertools.repeat(use_cache))
+        for vid, cues in zip(video_ids, transcripts):
+            lines = [
+                f"{url} (at {ts}s)"
+                for url, ts in scan_cues(vid, cues, pattern, first_only=args.first_only)
+            ]
+            if lines:
+                found = True
+                sys.stdout.write("\n".join(lines) + "\n")
 
     if not found:
         print("No occurrences found.")